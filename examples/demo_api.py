@@ -12,7 +12,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import hogtrace
-from hogtrace.ast import ActionType, ExpressionType
 
 
 def demo_basic_usage():
@@ -34,12 +33,10 @@ def demo_basic_usage():
     print(f"✓ Parsed {len(program.probes)} probe(s)\n")
 
     for probe in program.probes:
-        print(f"Probe: {probe.spec.module_function}:{probe.spec.probe_point}")
+        print(f"Probe: {probe.spec.specifier}:{probe.spec.target}")
         if probe.predicate:
-            print(f"  Has predicate: {probe.predicate.expression}")
-        print(f"  Actions: {len(probe.actions)}")
-        for action in probe.actions:
-            print(f"    - {action}")
+            print(f"  Predicate bytecode: {len(probe.predicate)} bytes")
+        print(f"  Body bytecode: {len(probe.body)} bytes")
 
 
 def demo_request_tracking():
@@ -80,16 +77,8 @@ def demo_request_tracking():
 
     for i, probe in enumerate(program.probes, 1):
         print(f"\nProbe #{i}: {probe.spec}")
-
-        # Count different action types
-        captures = sum(1 for a in probe.actions if a.type == ActionType.CAPTURE)
-        assignments = sum(1 for a in probe.actions if a.type == ActionType.ASSIGNMENT)
-        samples = sum(1 for a in probe.actions if a.type == ActionType.SAMPLE)
-
-        print(f"  Actions: {captures} captures, {assignments} assignments, {samples} samples")
-
-        if probe.predicate:
-            print(f"  Predicate: {probe.predicate.expression}")
+        print(f"  Predicate: {'yes' if probe.predicate else 'no'}")
+        print(f"  Body bytecode: {len(probe.body)} bytes")
 
 
 def demo_file_parsing():
@@ -99,29 +88,25 @@ def demo_file_parsing():
     print("=" * 60)
 
     try:
-        program = hogtrace.parse_file("tests/test_examples.hogtrace")
+        program = hogtrace.compile_file("tests/test_examples.hogtrace")
         print(f"✓ Loaded {len(program.probes)} probes from tests/test_examples.hogtrace\n")
 
         # Show stats
         with_predicates = sum(1 for p in program.probes if p.predicate)
-        with_sampling = sum(1 for p in program.probes
-                          if any(a.type == ActionType.SAMPLE for a in p.actions))
 
         print(f"Statistics:")
         print(f"  Total probes: {len(program.probes)}")
         print(f"  With predicates: {with_predicates}")
-        print(f"  With sampling: {with_sampling}")
-
-        # Show probe types
-        entry_probes = sum(1 for p in program.probes if 'entry' in p.spec.probe_point)
-        exit_probes = sum(1 for p in program.probes if 'exit' in p.spec.probe_point)
 
+        # Probes come pre-bucketed by target
         print(f"\nProbe points:")
-        print(f"  Entry probes: {entry_probes}")
-        print(f"  Exit probes: {exit_probes}")
+        print(f"  Entry probes: {len(program.entry_probes)}")
+        print(f"  Exit probes: {len(program.exit_probes)}")
 
     except FileNotFoundError:
         print("  (tests/test_examples.hogtrace not found - skipping)")
+    except hogtrace.CompilationError as e:
+        print(f"  (tests/test_examples.hogtrace does not compile - skipping: {e})")
 
 
 def demo_programmatic_access():
@@ -134,7 +119,6 @@ def demo_programmatic_access():
     fn:myapp.api.*:entry
     / rand() < 0.1 /
     {
-        sample 10%;
         capture(
             user=$req.user_id,
             endpoint=arg0,
@@ -147,30 +131,17 @@ def demo_programmatic_access():
     probe = program.probes[0]
 
     print("Probe details:")
-    print(f"  Provider: {probe.spec.provider}")
-    print(f"  Module/Function: {probe.spec.module_function}")
-    print(f"  Probe point: {probe.spec.probe_point}")
+    print(f"  Probe ID: {probe.id}")
+    print(f"  Specifier: {probe.spec.specifier}")
+    print(f"  Target: {probe.spec.target}")
     print(f"  Full spec: {probe.spec.full_spec}")
 
     if probe.predicate:
-        expr = probe.predicate.expression
         print(f"\nPredicate:")
-        print(f"  Expression type: {expr.type}")
-        print(f"  Raw: {expr.raw}")
-
-    print(f"\nActions:")
-    for action in probe.actions:
-        print(f"  Type: {action.type.value}")
+        print(f"  Bytecode: {probe.predicate.hex()}")
 
-        if action.type == ActionType.CAPTURE:
-            print(f"    Function: {action.function}")
-            print(f"    Positional args: {len(action.arguments)}")
-            print(f"    Named args: {list(action.named_arguments.keys())}")
-
-        elif action.type == ActionType.SAMPLE:
-            print(f"    Spec: {action.spec}")
-            print(f"    Is percentage: {action.is_percentage}")
-            print(f"    Value: {action.value}")
+    print(f"\nBody:")
+    print(f"  Bytecode: {len(probe.body)} bytes")
 
 
 def demo_iteration():
@@ -186,18 +157,15 @@ def demo_iteration():
     """
 
     program = hogtrace.parse(code)
+    probes = program.probes
 
-    # Programs are iterable
     print("Iterating over probes:")
-    for probe in program:
+    for probe in probes:
         print(f"  - {probe.spec}")
 
-    # Can use indexing
-    print(f"\nFirst probe: {program[0].spec}")
-    print(f"Last probe: {program[-1].spec}")
-
-    # Can get length
-    print(f"Total: {len(program)} probes")
+    print(f"\nFirst probe: {probes[0].spec}")
+    print(f"Last probe: {probes[-1].spec}")
+    print(f"Total: {len(probes)} probes")
 
 
 def demo_error_handling():
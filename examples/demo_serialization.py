@@ -1,15 +1,21 @@
 """
-Demo of JSON serialization for HogTrace programs.
+Demo of serialization for HogTrace programs.
 
 This demonstrates the typical workflow for storing and retrieving
-probe definitions in a database.
+probe definitions in a database using the protobuf round-trip
+(Program.to_bytes / Program.from_bytes).
 """
 
+import sys
+from pathlib import Path
+
+# Add parent directory to path so we can import hogtrace
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 import hogtrace
-import json
 
 print("=" * 70)
-print("HogTrace JSON Serialization Demo")
+print("HogTrace Serialization Demo")
 print("=" * 70)
 print()
 
@@ -57,16 +63,13 @@ except hogtrace.ParseError as e:
 
 print()
 
-# Step 3: Backend serializes to JSON for database storage
-print("3. Backend serializes to JSON for database storage:")
+# Step 3: Backend serializes to bytes for database storage
+print("3. Backend serializes to bytes for database storage:")
 print("-" * 70)
 
-json_definition = hogtrace.program_to_json(program)
-print(json_definition[:500] + "...")  # Show first 500 chars
-
-# Get size
-json_size = len(json_definition.encode('utf-8'))
-print(f"\nJSON size: {json_size} bytes")
+definition = program.to_bytes()
+print(f"Serialized program: {definition[:60].hex()}...")
+print(f"\nSerialized size: {len(definition)} bytes")
 print()
 
 # Step 4: Store in database (simulated)
@@ -76,7 +79,7 @@ print("-" * 70)
 debug_session_id = "uuid-abc-123-def-456"
 print(f"db.save_probe_definition(")
 print(f"    session_id='{debug_session_id}',")
-print(f"    definition=json_definition")
+print(f"    definition=definition")
 print(f")")
 print("✓ Stored in database")
 print()
@@ -86,22 +89,22 @@ print("5. Instrumentation library fetches probe definition:")
 print("-" * 70)
 
 # Simulated DB fetch
-fetched_json = json_definition
-print(f"fetched_json = db.fetch_probe_definition('{debug_session_id}')")
-print(f"✓ Fetched {len(fetched_json)} bytes from database")
+fetched = definition
+print(f"fetched = db.fetch_probe_definition('{debug_session_id}')")
+print(f"✓ Fetched {len(fetched)} bytes from database")
 print()
 
-# Step 6: Deserialize back to Program AST
-print("6. Deserialize JSON back to Program AST:")
+# Step 6: Deserialize back to a Program
+print("6. Deserialize bytes back to a Program:")
 print("-" * 70)
 
-restored_program = hogtrace.program_from_json(fetched_json)
+restored_program = hogtrace.Program.from_bytes(fetched)
 print(f"✓ Deserialized successfully: {len(restored_program.probes)} probes")
 for i, probe in enumerate(restored_program.probes):
     print(f"  - Probe {i+1}: {probe.spec.full_spec}")
     if probe.predicate:
-        print(f"    Predicate: {probe.predicate}")
-    print(f"    Actions: {len(probe.actions)}")
+        print(f"    Predicate bytecode: {len(probe.predicate)} bytes")
+    print(f"    Body bytecode: {len(probe.body)} bytes")
 print()
 
 # Step 7: Create executor and use it
@@ -131,25 +134,18 @@ for i in range(len(program.probes)):
 
     print(f"Probe {i+1}:")
     print(f"  Spec matches:      {orig.spec.full_spec == rest.spec.full_spec}")
-    print(f"  Predicate matches: {(orig.predicate is None) == (rest.predicate is None)}")
-    print(f"  Action count:      {len(orig.actions)} == {len(rest.actions)}")
+    print(f"  Predicate matches: {orig.predicate == rest.predicate}")
+    print(f"  Body matches:      {orig.body == rest.body}")
 
 print()
 
-# Show compact vs pretty JSON
-print("9. JSON formatting options:")
+# Show that re-serialization is free and stable
+print("9. Re-serialization:")
 print("-" * 70)
 
-compact_json = hogtrace.program_to_json(program, indent=None)
-pretty_json = hogtrace.program_to_json(program, indent=2)
-
-print(f"Compact JSON size: {len(compact_json.encode('utf-8'))} bytes")
-print(f"Pretty JSON size:  {len(pretty_json.encode('utf-8'))} bytes")
-print(f"Size difference:   {len(pretty_json) - len(compact_json)} chars")
-print()
-
-print("Compact JSON sample:")
-print(compact_json[:150] + "...")
+again = restored_program.to_bytes()
+print(f"Round-trip is stable: {again == definition}")
+print(f"Serialized size:      {len(again)} bytes")
 print()
 
 print("=" * 70)
@@ -7,14 +7,12 @@ Shows how to execute probes against running Python code.
 
 import sys
 from pathlib import Path
-import inspect
-import time
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import hogtrace
-from hogtrace.vm import ProbeExecutor, ProgramExecutor
+from hogtrace import ProbeExecutor, ProgramExecutor
 from hogtrace.request_store import RequestLocalStore, RequestContext
 
 
@@ -35,10 +33,10 @@ def demo_basic_execution():
     program = hogtrace.parse(code)
     probe = program.probes[0]
     store = RequestLocalStore()
-    executor = ProbeExecutor(probe, store)
+    executor = ProbeExecutor(program, probe, store)
 
     def test_function(x):
-        frame = inspect.currentframe()
+        frame = sys._getframe()
         result = executor.execute(frame)
         return result
 
@@ -93,23 +91,23 @@ def demo_request_tracking():
     store = RequestLocalStore()
 
     # Create executors for each probe
-    start_executor = ProbeExecutor(program.probes[0], store)
-    query_executor = ProbeExecutor(program.probes[1], store)
-    end_executor = ProbeExecutor(program.probes[2], store)
+    start_executor = ProbeExecutor(program, program.probes[0], store)
+    query_executor = ProbeExecutor(program, program.probes[1], store)
+    end_executor = ProbeExecutor(program, program.probes[2], store)
 
     # Simulate a request
     def request_start(request_id):
-        frame = inspect.currentframe()
+        frame = sys._getframe()
         result = start_executor.execute(frame)
         print(f"Request started: {result}")
 
     def db_query(sql):
-        frame = inspect.currentframe()
+        frame = sys._getframe()
         result = query_executor.execute(frame)
         print(f"DB query: {result}")
 
     def request_end():
-        frame = inspect.currentframe()
+        frame = sys._getframe()
         result = end_executor.execute(frame, retval="200 OK")
         print(f"Request ended: {result}")
         return "200 OK"
@@ -142,10 +140,10 @@ def demo_sampling():
     program = hogtrace.parse(code)
     probe = program.probes[0]
     store = RequestLocalStore()
-    executor = ProbeExecutor(probe, store)
+    executor = ProbeExecutor(program, probe, store)
 
     def high_traffic_function(request_id):
-        frame = inspect.currentframe()
+        frame = sys._getframe()
         return executor.execute(frame)
 
     # Call many times
@@ -182,7 +180,7 @@ def demo_object_introspection():
     program = hogtrace.parse(code)
     probe = program.probes[0]
     store = RequestLocalStore()
-    executor = ProbeExecutor(probe, store)
+    executor = ProbeExecutor(program, probe, store)
 
     class User:
         def __init__(self, username, role, permissions):
@@ -191,7 +189,7 @@ def demo_object_introspection():
             self.permissions = permissions
 
     def process_user(user):
-        frame = inspect.currentframe()
+        frame = sys._getframe()
         return executor.execute(frame)
 
     # Should fire
@@ -227,7 +225,7 @@ def demo_exception_tracking():
     program = hogtrace.parse(code)
     probe = program.probes[0]
     store = RequestLocalStore()
-    executor = ProbeExecutor(probe, store)
+    executor = ProbeExecutor(program, probe, store)
 
     def risky_operation(value):
         try:
@@ -235,7 +233,7 @@ def demo_exception_tracking():
                 raise ValueError("Negative value not allowed")
             return value * 2
         except Exception as e:
-            frame = inspect.currentframe()
+            frame = sys._getframe()
             result = executor.execute(frame, exception=e)
             print(f"Exception captured: {result}")
             raise
@@ -282,7 +280,7 @@ def demo_program_executor():
 
     def calculate(a, b):
         # Entry probes
-        frame = inspect.currentframe()
+        frame = sys._getframe()
         entry_results = program_executor.execute_all(frame)
         for probe_spec, data in entry_results:
             print(f"  Entry probe fired: {data}")
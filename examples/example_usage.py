@@ -3,157 +3,48 @@
 Example of using the HogTrace parser programmatically.
 
 This shows how to:
-1. Parse HogTrace code
-2. Walk the parse tree
+1. Parse HogTrace code with the native parser
+2. Inspect the compiled program
 3. Extract information from probes
+
+Parsing is handled entirely by the Rust extension: source text is lexed,
+parsed, and compiled to bytecode in a single pass, so no Python-level
+parse tree is built or walked.
 """
 
 import sys
 from pathlib import Path
-from antlr4 import *
 
-# Add generated/ to path so we can import the ANTLR-generated files
-_generated_dir = Path(__file__).parent.parent / "generated"
-if str(_generated_dir) not in sys.path:
-    sys.path.insert(0, str(_generated_dir))
+# Add parent directory to path so we can import hogtrace
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from HogTraceLexer import HogTraceLexer
-from HogTraceParser import HogTraceParser
-from HogTraceListener import HogTraceListener
+import hogtrace
 
 
-class HogTraceExtractor(HogTraceListener):
-    """
-    Example listener that extracts information from HogTrace programs.
+def summarize_program(program):
+    """Print a summary of the probes in a compiled program"""
+    print(f"\n{'='*60}")
+    print(f"Found {len(program.probes)} probe(s)")
+    print(f"{'='*60}\n")
 
-    This walks the parse tree and prints information about each probe.
-    You would extend this to build an AST or generate bytecode.
-    """
+    for i, probe in enumerate(program.probes, 1):
+        spec = probe.spec
+        print(f"Probe #{i}: fn:{spec.specifier}:{spec.target}")
+        print(f"  Probe ID: {probe.id}")
 
-    def __init__(self):
-        self.probes = []
-        self.current_probe = None
-
-    def enterProbe(self, ctx: HogTraceParser.ProbeContext):
-        """Called when entering a probe definition"""
-        self.current_probe = {
-            'spec': None,
-            'predicate': None,
-            'actions': []
-        }
-
-    def exitProbe(self, ctx: HogTraceParser.ProbeContext):
-        """Called when exiting a probe definition"""
-        if self.current_probe:
-            self.probes.append(self.current_probe)
-            self.current_probe = None
-
-    def enterProbeSpec(self, ctx: HogTraceParser.ProbeSpecContext):
-        """Extract probe specification"""
-        provider = ctx.provider.text
-        module_func = ctx.moduleFunction().getText()
-        probe_point = ctx.probePoint().getText()
-
-        self.current_probe['spec'] = {
-            'provider': provider,
-            'module_function': module_func,
-            'probe_point': probe_point,
-            'full_spec': f"{provider}:{module_func}:{probe_point}"
-        }
-
-    def enterPredicate(self, ctx: HogTraceParser.PredicateContext):
-        """Extract predicate expression"""
-        # Get the text between the / / delimiters
-        predicate_text = ctx.expression().getText()
-        self.current_probe['predicate'] = predicate_text
-
-    def enterCaptureStatement(self, ctx: HogTraceParser.CaptureStatementContext):
-        """Extract capture/send statements"""
-        action = ctx.getChild(0).getText()  # 'capture' or 'send'
-
-        args = []
-        if ctx.captureArgs():
-            # Extract argument expressions
-            for child in ctx.captureArgs().children:
-                if isinstance(child, HogTraceParser.ExpressionContext):
-                    args.append(child.getText())
-                elif isinstance(child, HogTraceParser.NamedArgContext):
-                    name = child.IDENTIFIER().getText()
-                    value = child.expression().getText()
-                    args.append(f"{name}={value}")
-
-        self.current_probe['actions'].append({
-            'type': 'capture',
-            'function': action,
-            'args': args
-        })
-
-    def enterSampleDirective(self, ctx: HogTraceParser.SampleDirectiveContext):
-        """Extract sampling directives"""
-        sample_spec = ctx.sampleSpec().getText()
-        self.current_probe['actions'].append({
-            'type': 'sample',
-            'spec': sample_spec
-        })
-
-    def enterAssignment(self, ctx: HogTraceParser.AssignmentContext):
-        """Extract request variable assignments"""
-        var_name = ctx.requestVar().getText()
-        value = ctx.expression().getText()
-
-        self.current_probe['actions'].append({
-            'type': 'assignment',
-            'variable': var_name,
-            'value': value
-        })
-
-    def print_summary(self):
-        """Print a summary of extracted probes"""
-        print(f"\n{'='*60}")
-        print(f"Found {len(self.probes)} probe(s)")
-        print(f"{'='*60}\n")
-
-        for i, probe in enumerate(self.probes, 1):
-            print(f"Probe #{i}: {probe['spec']['full_spec']}")
-
-            if probe['predicate']:
-                print(f"  Predicate: {probe['predicate']}")
-
-            if probe['actions']:
-                print(f"  Actions:")
-                for action in probe['actions']:
-                    if action['type'] == 'capture':
-                        args_str = ', '.join(action['args'])
-                        print(f"    - {action['function']}({args_str})")
-                    elif action['type'] == 'sample':
-                        print(f"    - sample {action['spec']}")
-                    elif action['type'] == 'assignment':
-                        print(f"    - {action['variable']} = {action['value']}")
-
-            print()
+        if probe.predicate:
+            print(f"  Predicate bytecode: {len(probe.predicate)} bytes")
+        else:
+            print(f"  Predicate: none (always fires)")
 
+        print(f"  Body bytecode: {len(probe.body)} bytes")
+        print()
 
-def parse_hogtrace_file(filename: str):
-    """Parse a HogTrace file and extract probe information"""
 
-    # Read the file
+def parse_hogtrace_file(filename: str):
+    """Parse a HogTrace file and return the compiled program"""
     with open(filename, 'r') as f:
-        input_stream = InputStream(f.read())
-
-    # Create lexer and parser
-    lexer = HogTraceLexer(input_stream)
-    stream = CommonTokenStream(lexer)
-    parser = HogTraceParser(stream)
-
-    # Parse the program
-    tree = parser.program()
-
-    # Walk the tree with our extractor
-    extractor = HogTraceExtractor()
-    walker = ParseTreeWalker()
-    walker.walk(extractor, tree)
-
-    return extractor
+        return hogtrace.parse(f.read())
 
 
 def main():
@@ -171,16 +62,8 @@ def main():
     }
     """
 
-    input_stream = InputStream(simple_code)
-    lexer = HogTraceLexer(input_stream)
-    stream = CommonTokenStream(lexer)
-    parser = HogTraceParser(stream)
-    tree = parser.program()
-
-    extractor = HogTraceExtractor()
-    walker = ParseTreeWalker()
-    walker.walk(extractor, tree)
-    extractor.print_summary()
+    program = hogtrace.parse(simple_code)
+    summarize_program(program)
 
     # Example 2: Parse a complex multi-probe program
     print("\nExample 2: Request tracking")
@@ -196,7 +79,6 @@ def main():
     fn:myapp.db.execute_query:entry
     / $req.request_id != None /
     {
-        sample 10%;
         capture(query=$req.request_id, sql=arg0);
     }
 
@@ -210,26 +92,20 @@ def main():
     }
     """
 
-    input_stream = InputStream(complex_code)
-    lexer = HogTraceLexer(input_stream)
-    stream = CommonTokenStream(lexer)
-    parser = HogTraceParser(stream)
-    tree = parser.program()
-
-    extractor = HogTraceExtractor()
-    walker = ParseTreeWalker()
-    walker.walk(extractor, tree)
-    extractor.print_summary()
+    program = hogtrace.parse(complex_code)
+    summarize_program(program)
 
     # Example 3: Parse from file
     print("\nExample 3: Parsing tests/test_examples.hogtrace")
     print("-" * 60)
 
     try:
-        extractor = parse_hogtrace_file('tests/test_examples.hogtrace')
-        extractor.print_summary()
+        program = parse_hogtrace_file('tests/test_examples.hogtrace')
+        summarize_program(program)
     except FileNotFoundError:
         print("File not found: tests/test_examples.hogtrace")
+    except hogtrace.ParseError as e:
+        print(f"Parse error: {e}")
 
 
 if __name__ == "__main__":
@@ -25,6 +25,9 @@ Usage:
     result = executor.execute(frame)
 """
 
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 # Import Rust VM components
@@ -38,8 +41,24 @@ from hogtrace.vm import (
     BYTECODE_VERSION,
 )
 
-# Import utilities
-from hogtrace.request_store import RequestLocalStore, RequestContext
+# Python-side utilities are imported lazily via __getattr__ (PEP 562) so
+# `import hogtrace` for parse/compile alone doesn't pay for them.
+_LAZY_IMPORTS = {
+    "ProgramExecutor": "hogtrace.executor",
+    "RequestLocalStore": "hogtrace.request_store",
+    "RequestContext": "hogtrace.request_store",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 # Serialization removed - use Program.to_bytes() / Program.from_bytes() instead
 # from hogtrace.serialization import (
@@ -55,17 +74,21 @@ __all__ = [
     # Core VM (Rust)
     "compile",
     "compile_file",
+    "parse",
+    "parse_bytes",
     "execute_probe",
     "Program",
     "Probe",
     "ProbeSpec",
     "ProbeExecutor",
+    "ProgramExecutor",
     "BYTECODE_VERSION",
     # Utilities
     "RequestLocalStore",
     "RequestContext",
     # Errors
     "CompilationError",
+    "ParseError",
 ]
 
 
@@ -75,6 +98,87 @@ class CompilationError(Exception):
     pass
 
 
+# Alias kept so callers can catch parse failures under the traditional name
+ParseError = CompilationError
+
+
+# Compiled programs are immutable from Python, so repeated parses of the
+# same source (fuzz loops, demos re-running fixed snippets) can share one
+# Program instance instead of re-running the lexer and compiler.
+_compile_cached = lru_cache(maxsize=1024)(compile)
+
+
+def parse(source: str) -> Program:
+    """
+    Parse and compile HogTrace source code.
+
+    This is a thin wrapper around the native Rust parser, which lexes,
+    parses, and compiles to bytecode in a single pass with no Python-level
+    parse tree.
+
+    Args:
+        source: HogTrace source code
+
+    Returns:
+        Program object with compiled bytecode
+
+    Raises:
+        ParseError: If the code has syntax errors
+
+    Example:
+        >>> program = hogtrace.parse("fn:myapp.test:entry { capture(args); }")
+        >>> len(program.probes)
+        1
+    """
+    # Fast-reject: every probe starts with the `fn` or `py` provider
+    # keyword, so source that mentions neither (and isn't just
+    # whitespace/comments) can't compile. The substring scans are C-level
+    # and far cheaper than lexing, which matters when fuzz harnesses feed
+    # mostly-garbage input at high rate.
+    if (
+        "fn" not in source
+        and "py" not in source
+        and "#" not in source
+        and "/*" not in source
+        and source.strip()
+    ):
+        raise ParseError("no probe specification found")
+    try:
+        return _compile_cached(source)
+    except ValueError as e:
+        raise ParseError(str(e)) from e
+
+
+def parse_bytes(data: bytes) -> Program:
+    """
+    Parse and compile HogTrace source from raw bytes.
+
+    Intended for callers that receive undecoded input (fuzz harnesses,
+    network payloads). Invalid UTF-8 is replaced rather than raised, so
+    malformed bytes surface uniformly as ParseError instead of
+    UnicodeDecodeError.
+
+    Args:
+        data: HogTrace source code as bytes
+
+    Returns:
+        Program object with compiled bytecode
+
+    Raises:
+        ParseError: If the code has syntax errors
+    """
+    # Same fast-reject as parse(), applied before paying for the decode.
+    if (
+        b"fn" not in data
+        and b"py" not in data
+        and b"#" not in data
+        and b"/*" not in data
+        and data.strip()
+    ):
+        raise ParseError("no probe specification found")
+    return parse(data.decode("utf-8", errors="replace"))
+
+
 def compile_file(file_path: str | Path) -> Program:
     """
     Compile a HogTrace file and return a Program.
@@ -89,20 +193,51 @@ def compile_file(file_path: str | Path) -> Program:
         CompilationError: If the code has syntax errors
         FileNotFoundError: If the file doesn't exist
 
+    A compiled-bytecode cache is kept in a sibling ``.hogtracec`` file,
+    like CPython's ``.pyc``: if the cache is at least as new as the source
+    and carries the current bytecode version, parsing is skipped entirely
+    and the program is deserialized from the cache. Stale, corrupt, or
+    unwritable caches are ignored and the source is compiled as usual.
+
     Example:
         >>> program = hogtrace.compile_file("traces.hogtrace")
         >>> for probe in program.probes:
         ...     print(probe.spec)
     """
     path = Path(file_path)
+    cache = path.with_suffix(".hogtracec")
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    with open(path, "r") as f:
-        code = f.read()
+    try:
+        if cache.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            cached = Program.from_bytes(cache.read_bytes())
+            # Reject caches written by an older bytecode format
+            if cached.version == BYTECODE_VERSION:
+                return cached
+    except (OSError, RuntimeError):
+        pass  # no cache, or unreadable/corrupt - fall through and compile
+
+    # Single read straight into the string handed to the native parser;
+    # a missing file surfaces as FileNotFoundError from read_text itself.
+    code = path.read_text(encoding="utf-8")
 
     try:
-        return compile(code)
+        program = compile(code)
     except ValueError as e:
         raise CompilationError(str(e)) from e
+
+    # Write the cache atomically (temp file + os.replace) so concurrent
+    # workers never observe a torn file. Failure to cache is not an error:
+    # read-only source directories just recompile every time.
+    try:
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".hogtracec")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(program.to_bytes())
+            os.replace(tmp, cache)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+    return program
@@ -0,0 +1,135 @@
+"""
+Python-level probe dispatch helpers for HogTrace.
+
+The Rust VM executes individual probes against frames; this module adds the
+glue needed to decide *which* probes apply to a given function. Probe
+specifiers may contain wildcards (e.g. ``myapp.api.*``), so each spec is
+compiled to a matcher once and reused for every dispatch.
+"""
+
+import re
+from fnmatch import translate
+from functools import lru_cache
+from types import FrameType
+from typing import Any, Callable, Optional
+
+from hogtrace.vm import ProbeExecutor, Program
+
+
+@lru_cache(maxsize=1024)
+def spec_matcher(specifier: str) -> Callable[[str], bool]:
+    """
+    Compile a probe specifier into a matcher callable.
+
+    Literal specifiers (the common case) compile to a plain string
+    equality check. Specifiers containing glob wildcards (* or ?) are
+    translated once to a compiled regex, so each subsequent dispatch is
+    a single C-level match instead of a per-call glob parse.
+
+    Args:
+        specifier: Probe specifier, e.g. "myapp.users.create" or "myapp.api.*"
+
+    Returns:
+        A callable taking a dotted function path and returning True if
+        the specifier matches it.
+
+    Example:
+        >>> matcher = spec_matcher("myapp.api.*")
+        >>> matcher("myapp.api.get_user")
+        True
+        >>> matcher("myapp.db.query")
+        False
+    """
+    if "*" in specifier or "?" in specifier:
+        match = re.compile(translate(specifier)).match
+        return lambda name: match(name) is not None
+    return specifier.__eq__
+
+
+class ProgramExecutor:
+    """
+    Executes all matching probes of a program against frames.
+
+    Probes with literal specifiers are indexed by (specifier, target) at
+    construction time, so dispatch for the common case is a single dict
+    lookup instead of a linear scan over every probe. Wildcard probes
+    are kept in a separate (usually short) list and matched with their
+    precompiled matchers.
+
+    Example:
+        store = RequestLocalStore()
+        executor = ProgramExecutor(program, store)
+
+        def create_user(user):
+            frame = sys._getframe()
+            for spec, data in executor.execute_all(frame):
+                handle(spec, data)
+    """
+
+    __slots__ = ("program", "store", "executors", "_by_exact", "_globbed")
+
+    def __init__(self, program: Program, store: Any):
+        self.program = program
+        self.store = store
+        self.executors = [
+            ProbeExecutor(program, probe, store) for probe in program.probes
+        ]
+
+        # (specifier, target) -> [executor] for literal specs;
+        # wildcard specs keep their compiled matcher alongside the executor.
+        self._by_exact: dict = {}
+        self._globbed: list = []
+        for probe, executor in zip(program.probes, self.executors):
+            spec = probe.spec
+            entry = (spec.full_spec, executor)
+            if "*" in spec.specifier or "?" in spec.specifier:
+                self._globbed.append((spec_matcher(spec.specifier), spec.target, entry))
+            else:
+                key = (spec.specifier, spec.target)
+                self._by_exact.setdefault(key, []).append(entry)
+
+    def _candidates(self, function_path: str, name: str, target: str):
+        """Yield (full_spec, executor) pairs matching a function and target"""
+        yield from self._by_exact.get((function_path, target), ())
+        # When the frame has no module (__name__ missing from f_globals),
+        # function_path is just the bare name; looking it up again would
+        # fire every matching probe twice.
+        if name != function_path:
+            yield from self._by_exact.get((name, target), ())
+        for matcher, probe_target, entry in self._globbed:
+            if probe_target == target and (matcher(function_path) or matcher(name)):
+                yield entry
+
+    def execute_all(
+        self,
+        frame: FrameType,
+        retval: Optional[Any] = None,
+        exception: Optional[BaseException] = None,
+    ) -> list:
+        """
+        Execute all probes matching the frame's function.
+
+        Entry probes fire when neither retval nor exception is given;
+        exit probes fire otherwise. Probes are matched against both the
+        dotted module path (module.function) and the bare function name.
+
+        Args:
+            frame: Python frame object for the traced function
+            retval: Optional return value (selects exit probes)
+            exception: Optional exception (selects exit probes)
+
+        Returns:
+            List of (full_spec, data) tuples for probes that fired
+        """
+        code = frame.f_code
+        name = code.co_name
+        module = frame.f_globals.get("__name__", "")
+        function_path = f"{module}.{name}" if module else name
+        target = "exit" if (retval is not None or exception is not None) else "entry"
+
+        results = []
+        for full_spec, executor in self._candidates(function_path, name, target):
+            data = executor.execute(frame, retval=retval, exception=exception)
+            if data is not None:
+                results.append((full_spec, data))
+        return results
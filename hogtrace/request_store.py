@@ -4,7 +4,6 @@ Request-scoped variable storage for HogTrace.
 This module provides thread-safe storage for per-request variables ($req.* or $request.*).
 """
 
-import threading
 from typing import Any, Optional
 from contextvars import ContextVar
 
@@ -13,8 +12,8 @@ class RequestLocalStore:
     """
     Thread-safe and async-safe storage for request-scoped variables.
 
-    Uses contextvars for proper async support, with threading.local as fallback.
-    This allows probes to set and read variables that persist across function
+    Uses contextvars, which work in both threaded and async code. This
+    allows probes to set and read variables that persist across function
     calls within a single request.
 
     Example:
@@ -27,6 +26,8 @@ class RequestLocalStore:
         user_id = store.get("user_id")  # Returns 123
     """
 
+    __slots__ = ("_context",)
+
     def __init__(self):
         # Use ContextVar for async-safe storage (Python 3.7+)
         # Each ContextVar holds a dict of variables for the current context
@@ -35,23 +36,15 @@ class RequestLocalStore:
             default=None
         )
 
-        # Fallback to thread-local storage for non-async contexts
-        self._thread_local = threading.local()
-
     def _get_storage(self) -> dict[str, Any]:
         """Get the storage dict for the current context"""
-        try:
-            # Try to get from context var (works in async)
-            storage = self._context.get()
-            if storage is None:
-                storage = {}
-                self._context.set(storage)
-            return storage
-        except LookupError:
-            # Fallback to thread-local
-            if not hasattr(self._thread_local, 'storage'):
-                self._thread_local.storage = {}
-            return self._thread_local.storage
+        # The ContextVar has a default, so get() never raises; this runs on
+        # every probe get/set and stays a couple of attribute loads
+        storage = self._context.get()
+        if storage is None:
+            storage = {}
+            self._context.set(storage)
+        return storage
 
     def set(self, name: str, value: Any) -> None:
         """
@@ -106,6 +99,19 @@ class RequestLocalStore:
         storage = self._get_storage()
         storage.clear()
 
+    def raw_storage(self) -> dict[str, Any]:
+        """
+        Get the live storage dict for the current context.
+
+        Unlike all(), this does not copy: callers performing many get/set
+        operations in one probe fire (e.g. the VM dispatcher) can fetch
+        the dict once and operate on it directly.
+
+        Returns:
+            The mutable storage dict backing this context
+        """
+        return self._get_storage()
+
     def all(self) -> dict[str, Any]:
         """
         Get all variables in the current context.
@@ -149,6 +155,8 @@ class RequestContext:
         # Variables cleared automatically
     """
 
+    __slots__ = ("store", "_token")
+
     def __init__(self, store: RequestLocalStore):
         self.store = store
         self._token = None
@@ -26,7 +26,13 @@ class ProbeSpec:
         """Get the probe target ('entry' or 'exit')."""
         ...
 
+    @property
+    def full_spec(self) -> str:
+        """Get the full probe specification (e.g., 'fn:myapp.users.create:entry')."""
+        ...
+
     def __repr__(self) -> str: ...
+    def __str__(self) -> str: ...
 
 class Probe:
     """A single probe with its specification and bytecode."""
@@ -64,6 +70,16 @@ class Program:
         """Get the list of probes in this program."""
         ...
 
+    @property
+    def entry_probes(self) -> List[Probe]:
+        """Get only the entry probes in this program."""
+        ...
+
+    @property
+    def exit_probes(self) -> List[Probe]:
+        """Get only the exit probes in this program."""
+        ...
+
     @property
     def version(self) -> int:
         """Get the bytecode format version."""
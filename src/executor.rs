@@ -5,7 +5,8 @@ use crate::value::Value;
 
 /// Bytecode executor for the HogTrace VM
 ///
-/// This is a stack-based VM with no control flow. Execution proceeds linearly
+/// This is a stack-based VM whose only control flow is the forward-only
+/// short-circuit jumps for && and ||. Execution otherwise proceeds linearly
 /// from start to end, and the final value on the stack is the result.
 ///
 /// The executor is generic over a Dispatcher, which handles all language-specific
@@ -118,6 +119,31 @@ impl<'a, D: Dispatcher> Executor<'a, D> {
                     self.stack.push(Value::Bool(result));
                 }
 
+                // Short-circuit jumps: skip the right operand of && / ||
+                // when the left side already decides the result
+                Opcode::JumpIfFalse => {
+                    let offset = self.read_u16(bytecode, &mut i)? as usize;
+                    let value = self.pop()?;
+                    if !value.is_truthy() {
+                        self.stack.push(Value::Bool(false));
+                        i += offset;
+                    }
+                }
+
+                Opcode::JumpIfTrue => {
+                    let offset = self.read_u16(bytecode, &mut i)? as usize;
+                    let value = self.pop()?;
+                    if value.is_truthy() {
+                        self.stack.push(Value::Bool(true));
+                        i += offset;
+                    }
+                }
+
+                Opcode::Truthy => {
+                    let value = self.pop()?;
+                    self.stack.push(Value::Bool(value.is_truthy()));
+                }
+
                 // Field/attribute access
                 Opcode::GetAttr => {
                     let index = self.read_u16(bytecode, &mut i)?;
@@ -1321,6 +1347,112 @@ mod tests {
         assert!(matches!(result, Value::Bool(true)));
     }
 
+    #[test]
+    fn test_short_circuit_and_skips_right_operand() {
+        // Bytecode: PUSH false, JUMP_IF_FALSE +4, LOAD_VAR unknown_var, TRUTHY
+        // The right operand would error (unknown variable) if evaluated;
+        // short-circuit must skip it and produce Bool(false)
+
+        let mut pool = ConstantPool::new();
+        pool.add(Constant::Bool(false));
+        pool.add(Constant::String("unknown_var".to_string()));
+
+        let bytecode = vec![
+            Opcode::PushConst as u8,
+            0,
+            0, // false
+            Opcode::JumpIfFalse as u8,
+            4,
+            0, // skip LoadVar [3] + Truthy [1]
+            Opcode::LoadVar as u8,
+            1,
+            0, // unknown_var (would error)
+            Opcode::Truthy as u8,
+        ];
+
+        let mut dispatcher = MockDispatcher::new();
+        let mut executor = Executor::new(&pool, &mut dispatcher);
+        let result = executor.execute(&bytecode).unwrap();
+
+        assert!(matches!(result, Value::Bool(false)));
+    }
+
+    #[test]
+    fn test_short_circuit_or_skips_right_operand() {
+        // Bytecode: PUSH true, JUMP_IF_TRUE +4, LOAD_VAR unknown_var, TRUTHY
+        // Expected: Bool(true) without touching the right operand
+
+        let mut pool = ConstantPool::new();
+        pool.add(Constant::Bool(true));
+        pool.add(Constant::String("unknown_var".to_string()));
+
+        let bytecode = vec![
+            Opcode::PushConst as u8,
+            0,
+            0, // true
+            Opcode::JumpIfTrue as u8,
+            4,
+            0,
+            Opcode::LoadVar as u8,
+            1,
+            0,
+            Opcode::Truthy as u8,
+        ];
+
+        let mut dispatcher = MockDispatcher::new();
+        let mut executor = Executor::new(&pool, &mut dispatcher);
+        let result = executor.execute(&bytecode).unwrap();
+
+        assert!(matches!(result, Value::Bool(true)));
+    }
+
+    #[test]
+    fn test_short_circuit_falls_through_to_right_operand() {
+        // Bytecode: LOAD_VAR is_active (true), JUMP_IF_FALSE +4,
+        //           LOAD_VAR test_var (42), TRUTHY
+        // Left is truthy, so the right operand decides: Bool(true)
+
+        let mut pool = ConstantPool::new();
+        pool.add(Constant::String("is_active".to_string()));
+        pool.add(Constant::String("test_var".to_string()));
+
+        let bytecode = vec![
+            Opcode::LoadVar as u8,
+            0,
+            0, // is_active (true)
+            Opcode::JumpIfFalse as u8,
+            4,
+            0,
+            Opcode::LoadVar as u8,
+            1,
+            0, // test_var (42)
+            Opcode::Truthy as u8,
+        ];
+
+        let mut dispatcher = MockDispatcher::new();
+        let mut executor = Executor::new(&pool, &mut dispatcher);
+        let result = executor.execute(&bytecode).unwrap();
+
+        assert!(matches!(result, Value::Bool(true)));
+    }
+
+    #[test]
+    fn test_truthy_coerces_to_bool() {
+        // Bytecode: LOAD_VAR test_var (42), TRUTHY
+        // Expected: Bool(true)
+
+        let mut pool = ConstantPool::new();
+        pool.add(Constant::String("test_var".to_string()));
+
+        let bytecode = vec![Opcode::LoadVar as u8, 0, 0, Opcode::Truthy as u8];
+
+        let mut dispatcher = MockDispatcher::new();
+        let mut executor = Executor::new(&pool, &mut dispatcher);
+        let result = executor.execute(&bytecode).unwrap();
+
+        assert!(matches!(result, Value::Bool(true)));
+    }
+
     #[test]
     fn test_predicate_with_negation() {
         // Simulates: !(is_enabled) && is_active
@@ -50,7 +50,11 @@ pub use python_dispatcher::PythonDispatcher;
 pub use value::Value;
 
 /// Current bytecode format version
-pub const BYTECODE_VERSION: u32 = 1;
+///
+/// Version history:
+/// - 1: initial format
+/// - 2: short-circuit jump opcodes (JUMP_IF_FALSE, JUMP_IF_TRUE, TRUTHY)
+pub const BYTECODE_VERSION: u32 = 2;
 
 #[cfg(test)]
 mod integration_tests {
@@ -1,7 +1,9 @@
 /// Bytecode instruction set for the HogTrace VM
 ///
-/// This is a stack-based VM with no control flow (no jumps, no conditionals).
-/// Execution proceeds linearly from start to end, with the final stack value as the result.
+/// This is a stack-based VM with no general control flow: the only jumps are
+/// the forward-only short-circuit jumps the compiler emits for && and ||.
+/// Execution otherwise proceeds linearly from start to end, with the final
+/// stack value as the result.
 /// Opcodes are single bytes (u8) for compact representation
 #[repr(u8)]
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -47,6 +49,19 @@ pub enum Opcode {
     Or = 0x41,  // a || b (binary, pop 2, push 1)
     Not = 0x42, // !a (unary, pop 1, push 1)
 
+    // Short-circuit jumps (the only control flow in the VM: forward-only,
+    // emitted exclusively by the compiler for && and ||)
+    /// Pop a value; if falsy, push Bool(false) and jump forward
+    /// Operand: u16 (byte offset past the skipped right operand)
+    JumpIfFalse = 0x43,
+
+    /// Pop a value; if truthy, push Bool(true) and jump forward
+    /// Operand: u16 (byte offset past the skipped right operand)
+    JumpIfTrue = 0x44,
+
+    /// Coerce top of stack to its truthiness: pop a, push Bool(a)
+    Truthy = 0x45,
+
     // Field/attribute access
     /// Get attribute from object: obj.field
     /// Operand: u16 (constant pool index for field name)
@@ -94,6 +109,9 @@ impl Opcode {
             0x40 => Ok(Opcode::And),
             0x41 => Ok(Opcode::Or),
             0x42 => Ok(Opcode::Not),
+            0x43 => Ok(Opcode::JumpIfFalse),
+            0x44 => Ok(Opcode::JumpIfTrue),
+            0x45 => Ok(Opcode::Truthy),
             0x50 => Ok(Opcode::GetAttr),
             0x51 => Ok(Opcode::GetItem),
             0x52 => Ok(Opcode::SetAttr),
@@ -109,7 +127,9 @@ impl Opcode {
             | Opcode::LoadVar
             | Opcode::StoreVar
             | Opcode::GetAttr
-            | Opcode::SetAttr => 2,
+            | Opcode::SetAttr
+            | Opcode::JumpIfFalse
+            | Opcode::JumpIfTrue => 2,
 
             Opcode::CallFunc => 3,
 
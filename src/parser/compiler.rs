@@ -6,10 +6,34 @@ use super::ast::{
 };
 use super::error::{ParseError, ParseResult};
 use crate::constant_pool::{Constant, ConstantPool};
+use crate::dispatcher::{
+    BinaryOp as VmBinaryOp, ComparisonOp, binary_op_default, comparison_op_default,
+};
 use crate::opcodes::Opcode;
+use crate::value::Value;
 use crate::{FnTarget, Probe, ProbeSpec, Program};
 use std::collections::HashMap;
 
+/// Functions callable from probe expressions
+///
+/// Function names are compile-time constants, so the safety check happens
+/// once here rather than on every CallFunc at runtime. Everything listed is
+/// either implemented natively by the dispatcher or a side-effect-free
+/// Python builtin; unlisted names (getattr, eval, ...) are rejected.
+const ALLOWED_FUNCTIONS: &[&str] = &[
+    "timestamp",
+    "rand",
+    "len",
+    "str",
+    "int",
+    "float",
+    "min",
+    "max",
+    "abs",
+    "capture",
+    "send",
+];
+
 /// Compiler that translates AST to VM bytecode
 pub struct Compiler {
     /// Shared constant pool for the entire program
@@ -65,13 +89,26 @@ impl Compiler {
     pub fn compile(&mut self, ast: AstProgram) -> ParseResult<Program> {
         let mut probes = Vec::new();
 
-        for (idx, ast_probe) in ast.probes.into_iter().enumerate() {
-            let probe = self.compile_probe(ast_probe, idx)?;
+        for mut ast_probe in ast.probes.into_iter() {
+            // Constant predicates are resolved here: an always-true guard
+            // costs nothing per fire, and an always-false probe can never
+            // fire so it is not installed at all
+            if let Some(pred) = &ast_probe.predicate
+                && let Some(value) = Self::try_const_eval(pred)
+            {
+                if value.is_truthy() {
+                    ast_probe.predicate = None;
+                } else {
+                    continue;
+                }
+            }
+
+            let probe = self.compile_probe(ast_probe, probes.len())?;
             probes.push(probe);
         }
 
         Ok(Program {
-            version: 1,
+            version: crate::BYTECODE_VERSION,
             constant_pool: self.constant_pool.clone(),
             probes,
             sampling: 1.0, // Default sampling rate
@@ -130,8 +167,118 @@ impl Compiler {
         std::mem::take(&mut self.bytecode)
     }
 
+    /// Try to evaluate an expression at compile time
+    ///
+    /// Only subtrees built entirely from literals fold; anything touching a
+    /// variable, field, index, or function call is left for runtime. Folding
+    /// reuses the VM's default operator semantics so the result is
+    /// bit-for-bit what execution would produce. Expressions whose evaluation
+    /// would error (division by zero, cross-type arithmetic) are not folded,
+    /// so they still fail at runtime rather than at compile time.
+    fn try_const_eval(expr: &AstExpr) -> Option<Value> {
+        match expr {
+            AstExpr::Int { value, .. } => Some(Value::Int(*value)),
+            AstExpr::Float { value, .. } => Some(Value::Float(*value)),
+            AstExpr::String { value, .. } => Some(Value::String(value.clone())),
+            AstExpr::Bool { value, .. } => Some(Value::Bool(*value)),
+            AstExpr::None { .. } => Some(Value::None),
+
+            AstExpr::Binary {
+                op, left, right, ..
+            } => {
+                // && and || mirror the short-circuit: a deciding constant
+                // left operand folds regardless of the right operand, since
+                // the right operand would never execute anyway
+                if matches!(op, BinaryOp::And | BinaryOp::Or) {
+                    let l = Self::try_const_eval(left)?;
+                    let decides = match op {
+                        BinaryOp::And => !l.is_truthy(),
+                        _ => l.is_truthy(),
+                    };
+                    if decides {
+                        return Some(Value::Bool(l.is_truthy()));
+                    }
+                    let r = Self::try_const_eval(right)?;
+                    return Some(Value::Bool(r.is_truthy()));
+                }
+
+                let l = Self::try_const_eval(left)?;
+                let r = Self::try_const_eval(right)?;
+                let result = match op {
+                    BinaryOp::Add => binary_op_default(VmBinaryOp::Add, &l, &r),
+                    BinaryOp::Sub => binary_op_default(VmBinaryOp::Sub, &l, &r),
+                    BinaryOp::Mul => binary_op_default(VmBinaryOp::Mul, &l, &r),
+                    BinaryOp::Div => binary_op_default(VmBinaryOp::Div, &l, &r),
+                    BinaryOp::Mod => binary_op_default(VmBinaryOp::Mod, &l, &r),
+                    BinaryOp::Eq => comparison_op_default(ComparisonOp::Eq, &l, &r),
+                    BinaryOp::NotEq => comparison_op_default(ComparisonOp::Ne, &l, &r),
+                    BinaryOp::Lt => comparison_op_default(ComparisonOp::Lt, &l, &r),
+                    BinaryOp::Gt => comparison_op_default(ComparisonOp::Gt, &l, &r),
+                    BinaryOp::LtEq => comparison_op_default(ComparisonOp::Le, &l, &r),
+                    BinaryOp::GtEq => comparison_op_default(ComparisonOp::Ge, &l, &r),
+                    BinaryOp::And | BinaryOp::Or => unreachable!("handled above"),
+                };
+                result.ok()
+            }
+
+            AstExpr::Unary { op, expr, .. } => match op {
+                UnaryOp::Not => {
+                    let v = Self::try_const_eval(expr)?;
+                    Some(Value::Bool(!v.is_truthy()))
+                }
+            },
+
+            AstExpr::Call { function, args, .. } => {
+                // Only the natively-implemented pure conversions fold;
+                // rand/timestamp are impure and capture/send have side
+                // effects, so they must stay runtime calls
+                if args.len() != 1 {
+                    return None;
+                }
+                let v = Self::try_const_eval(&args[0])?;
+                match function.as_str() {
+                    "len" => match v {
+                        Value::String(s) => Some(Value::Int(s.chars().count() as i64)),
+                        _ => None,
+                    },
+                    "str" => Some(Value::String(format!("{}", v))),
+                    "int" => v.as_int().ok().map(Value::Int),
+                    "float" => v.as_float().ok().map(Value::Float),
+                    _ => None,
+                }
+            }
+
+            _ => None,
+        }
+    }
+
+    /// Convert a folded Value back to a pool Constant
+    fn value_to_constant(value: Value) -> Option<Constant> {
+        match value {
+            Value::Int(i) => Some(Constant::Int(i)),
+            Value::Float(f) => Some(Constant::Float(f)),
+            Value::String(s) => Some(Constant::String(s)),
+            Value::Bool(b) => Some(Constant::Bool(b)),
+            Value::None => Some(Constant::None),
+            _ => None,
+        }
+    }
+
     /// Compile an expression into bytecode
     fn compile_expr(&mut self, expr: &AstExpr) -> ParseResult<()> {
+        // Fold constant operator subtrees into a single PushConst. Literals
+        // themselves take the normal path below; only composite expressions
+        // benefit from folding.
+        if matches!(
+            expr,
+            AstExpr::Binary { .. } | AstExpr::Unary { .. } | AstExpr::Call { .. }
+        ) && let Some(constant) = Self::try_const_eval(expr).and_then(Self::value_to_constant)
+        {
+            let idx = self.add_or_get_constant(constant);
+            self.emit_u16(Opcode::PushConst, idx);
+            return Ok(());
+        }
+
         match expr {
             AstExpr::Int { value, .. } => {
                 let idx = self.add_or_get_constant(Constant::Int(*value));
@@ -179,8 +326,37 @@ impl Compiler {
                 op,
                 left,
                 right,
-                span: _,
+                span,
             } => {
+                // && and || short-circuit: when the left operand already
+                // decides the result, a forward jump skips the right operand
+                // entirely. The jump offset is back-patched once the right
+                // side's length is known.
+                if matches!(op, BinaryOp::And | BinaryOp::Or) {
+                    self.compile_expr(left)?;
+                    let jump = match op {
+                        BinaryOp::And => Opcode::JumpIfFalse,
+                        _ => Opcode::JumpIfTrue,
+                    };
+                    self.emit(jump);
+                    let patch_at = self.bytecode.len();
+                    self.bytecode.extend_from_slice(&[0, 0]); // placeholder offset
+                    self.compile_expr(right)?;
+                    // Coerce so both paths leave a Bool, matching And/Or
+                    self.emit(Opcode::Truthy);
+                    let offset = self.bytecode.len() - (patch_at + 2);
+                    if offset > u16::MAX as usize {
+                        return Err(ParseError::at_span(
+                            "Right operand of logical operator is too large to skip".to_string(),
+                            *span,
+                        )
+                        .boxed());
+                    }
+                    self.bytecode[patch_at..patch_at + 2]
+                        .copy_from_slice(&(offset as u16).to_le_bytes());
+                    return Ok(());
+                }
+
                 // Compile left operand (pushes value onto stack)
                 self.compile_expr(left)?;
 
@@ -221,8 +397,18 @@ impl Compiler {
             AstExpr::FieldAccess {
                 object,
                 field,
-                span: _,
+                span,
             } => {
+                // Field names are static, so private-attribute access is
+                // rejected here instead of on every GetAttr at runtime
+                if field.starts_with('_') {
+                    return Err(ParseError::at_span(
+                        format!("Access to private attribute '{}' is not allowed", field),
+                        *span,
+                    )
+                    .boxed());
+                }
+
                 // Compile object expression (pushes object onto stack)
                 self.compile_expr(object)?;
 
@@ -251,6 +437,14 @@ impl Compiler {
                 args,
                 span,
             } => {
+                if !ALLOWED_FUNCTIONS.contains(&function.as_str()) {
+                    return Err(ParseError::at_span(
+                        format!("Unknown or disallowed function '{}'", function),
+                        *span,
+                    )
+                    .boxed());
+                }
+
                 // Compile each argument (left to right)
                 for arg in args {
                     self.compile_expr(arg)?;
@@ -674,115 +868,244 @@ mod tests {
 
     #[test]
     fn test_compile_binary_add() {
-        let (bytecode, _pool) = compile_expr_helper("1 + 2");
+        let (bytecode, _pool) = compile_expr_helper("arg0 + 2");
 
-        // Should be: PushConst(1), PushConst(2), Add
-        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        // Should be: LoadVar(arg0), PushConst(2), Add
+        assert_eq!(bytecode[0], Opcode::LoadVar as u8);
         assert_eq!(bytecode[3], Opcode::PushConst as u8);
         assert_eq!(bytecode[6], Opcode::Add as u8);
     }
 
     #[test]
     fn test_compile_binary_subtract() {
-        let (bytecode, _pool) = compile_expr_helper("10 - 3");
+        let (bytecode, _pool) = compile_expr_helper("arg0 - 3");
 
-        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        assert_eq!(bytecode[0], Opcode::LoadVar as u8);
         assert_eq!(bytecode[3], Opcode::PushConst as u8);
         assert_eq!(bytecode[6], Opcode::Sub as u8);
     }
 
     #[test]
     fn test_compile_binary_multiply() {
-        let (bytecode, _pool) = compile_expr_helper("5 * 6");
+        let (bytecode, _pool) = compile_expr_helper("arg0 * 6");
 
-        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        assert_eq!(bytecode[0], Opcode::LoadVar as u8);
         assert_eq!(bytecode[3], Opcode::PushConst as u8);
         assert_eq!(bytecode[6], Opcode::Mul as u8);
     }
 
     #[test]
     fn test_compile_binary_divide() {
-        let (bytecode, _pool) = compile_expr_helper("12 / 4");
+        let (bytecode, _pool) = compile_expr_helper("arg0 / 4");
 
-        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        assert_eq!(bytecode[0], Opcode::LoadVar as u8);
         assert_eq!(bytecode[3], Opcode::PushConst as u8);
         assert_eq!(bytecode[6], Opcode::Div as u8);
     }
 
     #[test]
     fn test_compile_binary_modulo() {
-        let (bytecode, _pool) = compile_expr_helper("10 % 3");
+        let (bytecode, _pool) = compile_expr_helper("arg0 % 3");
 
-        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        assert_eq!(bytecode[0], Opcode::LoadVar as u8);
         assert_eq!(bytecode[3], Opcode::PushConst as u8);
         assert_eq!(bytecode[6], Opcode::Mod as u8);
     }
 
     #[test]
     fn test_compile_comparison_eq() {
-        let (bytecode, _pool) = compile_expr_helper("1 == 2");
+        let (bytecode, _pool) = compile_expr_helper("arg0 == 2");
 
         assert_eq!(bytecode[6], Opcode::Eq as u8);
     }
 
     #[test]
     fn test_compile_comparison_ne() {
-        let (bytecode, _pool) = compile_expr_helper("1 != 2");
+        let (bytecode, _pool) = compile_expr_helper("arg0 != 2");
 
         assert_eq!(bytecode[6], Opcode::Ne as u8);
     }
 
     #[test]
     fn test_compile_comparison_lt() {
-        let (bytecode, _pool) = compile_expr_helper("1 < 2");
+        let (bytecode, _pool) = compile_expr_helper("arg0 < 2");
 
         assert_eq!(bytecode[6], Opcode::Lt as u8);
     }
 
     #[test]
     fn test_compile_comparison_gt() {
-        let (bytecode, _pool) = compile_expr_helper("1 > 2");
+        let (bytecode, _pool) = compile_expr_helper("arg0 > 2");
 
         assert_eq!(bytecode[6], Opcode::Gt as u8);
     }
 
     #[test]
     fn test_compile_comparison_le() {
-        let (bytecode, _pool) = compile_expr_helper("1 <= 2");
+        let (bytecode, _pool) = compile_expr_helper("arg0 <= 2");
 
         assert_eq!(bytecode[6], Opcode::Le as u8);
     }
 
     #[test]
     fn test_compile_comparison_ge() {
-        let (bytecode, _pool) = compile_expr_helper("1 >= 2");
+        let (bytecode, _pool) = compile_expr_helper("arg0 >= 2");
 
         assert_eq!(bytecode[6], Opcode::Ge as u8);
     }
 
     #[test]
     fn test_compile_logical_and() {
-        let (bytecode, _pool) = compile_expr_helper("True && False");
+        let (bytecode, _pool) = compile_expr_helper("arg0 && False");
 
-        assert_eq!(bytecode[6], Opcode::And as u8);
+        // Should be: LoadVar(arg0), JumpIfFalse(+4), PushConst(False), Truthy
+        assert_eq!(bytecode[3], Opcode::JumpIfFalse as u8);
+        let offset = u16::from_le_bytes([bytecode[4], bytecode[5]]);
+        assert_eq!(offset as usize, 4); // skips PushConst(False) + Truthy
+        assert_eq!(bytecode[6], Opcode::PushConst as u8);
+        assert_eq!(bytecode[9], Opcode::Truthy as u8);
     }
 
     #[test]
     fn test_compile_logical_or() {
-        let (bytecode, _pool) = compile_expr_helper("True || False");
+        let (bytecode, _pool) = compile_expr_helper("arg0 || False");
 
-        assert_eq!(bytecode[6], Opcode::Or as u8);
+        // Should be: LoadVar(arg0), JumpIfTrue(+4), PushConst(False), Truthy
+        assert_eq!(bytecode[3], Opcode::JumpIfTrue as u8);
+        let offset = u16::from_le_bytes([bytecode[4], bytecode[5]]);
+        assert_eq!(offset as usize, 4);
+        assert_eq!(bytecode[6], Opcode::PushConst as u8);
+        assert_eq!(bytecode[9], Opcode::Truthy as u8);
     }
 
     #[test]
     fn test_compile_unary_not() {
-        let (bytecode, _pool) = compile_expr_helper("!True");
+        let (bytecode, _pool) = compile_expr_helper("!arg0");
 
-        // Should be: PushConst(True), Not
-        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        // Should be: LoadVar(arg0), Not
+        assert_eq!(bytecode[0], Opcode::LoadVar as u8);
         assert_eq!(bytecode[3], Opcode::Not as u8);
     }
 
+    #[test]
+    fn test_fold_constant_arithmetic() {
+        let (bytecode, pool) = compile_expr_helper("(1 + 2) * 3");
+
+        // Entire subtree is literal, so it folds to a single PushConst(9)
+        assert_eq!(bytecode.len(), 3);
+        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        let idx = u16::from_le_bytes([bytecode[1], bytecode[2]]);
+        assert!(matches!(pool.get(idx).unwrap(), Constant::Int(9)));
+    }
+
+    #[test]
+    fn test_fold_constant_comparison() {
+        let (bytecode, pool) = compile_expr_helper("10 > 2");
+
+        assert_eq!(bytecode.len(), 3);
+        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        let idx = u16::from_le_bytes([bytecode[1], bytecode[2]]);
+        assert!(matches!(pool.get(idx).unwrap(), Constant::Bool(true)));
+    }
+
+    #[test]
+    fn test_fold_constant_logical_and_not() {
+        let (bytecode, pool) = compile_expr_helper("!(True && False)");
+
+        assert_eq!(bytecode.len(), 3);
+        let idx = u16::from_le_bytes([bytecode[1], bytecode[2]]);
+        assert!(matches!(pool.get(idx).unwrap(), Constant::Bool(true)));
+    }
+
+    #[test]
+    fn test_fold_string_concatenation() {
+        let (bytecode, pool) = compile_expr_helper("\"foo\" + \"bar\"");
+
+        assert_eq!(bytecode.len(), 3);
+        let idx = u16::from_le_bytes([bytecode[1], bytecode[2]]);
+        assert!(matches!(pool.get(idx).unwrap(), Constant::String(s) if s == "foobar"));
+    }
+
+    #[test]
+    fn test_fold_deciding_and_skips_nonconstant_right() {
+        // `False && x` short-circuits at runtime, so it folds even though
+        // the right operand is not constant
+        let (bytecode, pool) = compile_expr_helper("False && arg0");
+
+        assert_eq!(bytecode.len(), 3);
+        let idx = u16::from_le_bytes([bytecode[1], bytecode[2]]);
+        assert!(matches!(pool.get(idx).unwrap(), Constant::Bool(false)));
+    }
+
+    #[test]
+    fn test_fold_pure_conversion_call() {
+        let (bytecode, pool) = compile_expr_helper("len(\"hello\") + 1");
+
+        assert_eq!(bytecode.len(), 3);
+        let idx = u16::from_le_bytes([bytecode[1], bytecode[2]]);
+        assert!(matches!(pool.get(idx).unwrap(), Constant::Int(6)));
+    }
+
+    #[test]
+    fn test_fold_impure_call_left_for_runtime() {
+        let (bytecode, _pool) = compile_expr_helper("rand() < 0.5");
+
+        // rand() must run per fire, so nothing folds
+        assert_eq!(bytecode[0], Opcode::CallFunc as u8);
+    }
+
+    #[test]
+    fn test_fold_division_by_zero_left_for_runtime() {
+        let (bytecode, _pool) = compile_expr_helper("1 / 0");
+
+        // Would error at runtime, so folding must not hide (or trigger) it
+        assert_eq!(bytecode[6], Opcode::Div as u8);
+    }
+
+    #[test]
+    fn test_fold_skips_nonconstant_operands() {
+        let (bytecode, _pool) = compile_expr_helper("arg0 + 1");
+
+        assert_eq!(bytecode[0], Opcode::LoadVar as u8);
+        assert_eq!(bytecode[6], Opcode::Add as u8);
+    }
+
+    #[test]
+    fn test_compile_disallowed_function_rejected() {
+        let lexer = Lexer::new("eval(arg0)");
+        let mut parser = Parser::new(lexer);
+        let expr = parser.parse_expr().unwrap();
+
+        let mut compiler = Compiler::new();
+        let result = compiler.compile_expr(&expr);
+
+        assert!(result.is_err());
+        assert!(
+            result
+                .unwrap_err()
+                .to_string()
+                .contains("disallowed function")
+        );
+    }
+
+    #[test]
+    fn test_compile_private_field_access_rejected() {
+        let lexer = Lexer::new("args._secret");
+        let mut parser = Parser::new(lexer);
+        let expr = parser.parse_expr().unwrap();
+
+        let mut compiler = Compiler::new();
+        let result = compiler.compile_expr(&expr);
+
+        assert!(result.is_err());
+        assert!(
+            result
+                .unwrap_err()
+                .to_string()
+                .contains("private attribute")
+        );
+    }
+
     #[test]
     fn test_compile_field_access() {
         let (bytecode, pool) = compile_expr_helper("args.user");
@@ -846,10 +1169,10 @@ mod tests {
 
     #[test]
     fn test_compile_complex_expr() {
-        let (bytecode, _pool) = compile_expr_helper("(1 + 2) * 3");
+        let (bytecode, _pool) = compile_expr_helper("(arg0 + 2) * 3");
 
-        // Should be: PushConst(1), PushConst(2), Add, PushConst(3), Mul
-        assert_eq!(bytecode[0], Opcode::PushConst as u8);
+        // Should be: LoadVar(arg0), PushConst(2), Add, PushConst(3), Mul
+        assert_eq!(bytecode[0], Opcode::LoadVar as u8);
         assert_eq!(bytecode[3], Opcode::PushConst as u8);
         assert_eq!(bytecode[6], Opcode::Add as u8);
         assert_eq!(bytecode[7], Opcode::PushConst as u8);
@@ -936,7 +1259,7 @@ mod tests {
         let mut compiler = Compiler::new();
         let program = compiler.compile(ast).unwrap();
 
-        assert_eq!(program.version, 1);
+        assert_eq!(program.version, crate::BYTECODE_VERSION);
         assert_eq!(program.probes.len(), 1);
         assert_eq!(program.probes[0].id, "probe_0");
         assert!(program.probes[0].predicate.is_empty());
@@ -962,6 +1285,52 @@ mod tests {
         assert!(!program.probes[0].body.is_empty()); // Has body
     }
 
+    #[test]
+    fn test_compile_always_true_predicate_elided() {
+        let source = r#"fn:myapp.test:entry
+/ 1 == 1 /
+{
+    capture(args);
+}"#;
+        let lexer = Lexer::new(source);
+        let mut parser = Parser::new(lexer);
+        let ast = parser.parse_program().unwrap();
+
+        let mut compiler = Compiler::new();
+        let program = compiler.compile(ast).unwrap();
+
+        // Trivially-true guard compiles to no predicate at all
+        assert_eq!(program.probes.len(), 1);
+        assert!(program.probes[0].predicate.is_empty());
+    }
+
+    #[test]
+    fn test_compile_always_false_probe_dropped() {
+        let source = r#"fn:myapp.never:entry
+/ False /
+{
+    capture(args);
+}
+
+fn:myapp.always:entry
+{
+    capture(args);
+}"#;
+        let lexer = Lexer::new(source);
+        let mut parser = Parser::new(lexer);
+        let ast = parser.parse_program().unwrap();
+
+        let mut compiler = Compiler::new();
+        let program = compiler.compile(ast).unwrap();
+
+        // The never-firing probe is not installed; ids stay contiguous
+        assert_eq!(program.probes.len(), 1);
+        assert_eq!(program.probes[0].id, "probe_0");
+        match &program.probes[0].spec {
+            ProbeSpec::Fn { specifier, .. } => assert_eq!(specifier, "myapp.always"),
+        }
+    }
+
     #[test]
     fn test_compile_multiple_probes() {
         let source = r#"fn:myapp.start:entry
@@ -1119,20 +1488,26 @@ fn:myapp.test2:entry
 
         // Predicate should be:
         // LoadVar(arg0) [3], PushConst(10) [3], Gt [1],
+        // JumpIfFalse(+8) [3],
         // LoadVar(arg1) [3], PushConst(None) [3], Ne [1],
-        // And [1] = 15 bytes total
-        assert_eq!(probe.predicate.len(), 15); // 3 + 3 + 1 + 3 + 3 + 1 + 1
+        // Truthy [1] = 18 bytes total
+        assert_eq!(probe.predicate.len(), 18); // 3 + 3 + 1 + 3 + 3 + 3 + 1 + 1
 
         // First part: arg0 > 10
         assert_eq!(probe.predicate[0], Opcode::LoadVar as u8);
         assert_eq!(probe.predicate[3], Opcode::PushConst as u8);
         assert_eq!(probe.predicate[6], Opcode::Gt as u8);
 
+        // Short-circuit over the second comparison
+        assert_eq!(probe.predicate[7], Opcode::JumpIfFalse as u8);
+        let offset = u16::from_le_bytes([probe.predicate[8], probe.predicate[9]]);
+        assert_eq!(offset as usize, 8); // skips arg1 != None + Truthy
+
         // Second part: arg1 != None
-        assert_eq!(probe.predicate[7], Opcode::LoadVar as u8);
-        assert_eq!(probe.predicate[10], Opcode::PushConst as u8);
-        assert_eq!(probe.predicate[13], Opcode::Ne as u8);
-        assert_eq!(probe.predicate[14], Opcode::And as u8); // Final And
+        assert_eq!(probe.predicate[10], Opcode::LoadVar as u8);
+        assert_eq!(probe.predicate[13], Opcode::PushConst as u8);
+        assert_eq!(probe.predicate[16], Opcode::Ne as u8);
+        assert_eq!(probe.predicate[17], Opcode::Truthy as u8);
     }
 
     #[test]
@@ -1331,11 +1706,13 @@ fn:myapp.test2:entry
             probe.predicate.len()
         );
 
-        // LoadVar(arg0) [3], PushConst(10) [3], Lt [1], LoadVar(arg0) [3], PushConst(100) [3], Ge [1], Or [1] = 15 bytes
-        assert_eq!(probe.predicate.len(), 15);
+        // LoadVar(arg0) [3], PushConst(10) [3], Lt [1], JumpIfTrue(+8) [3],
+        // LoadVar(arg0) [3], PushConst(100) [3], Ge [1], Truthy [1] = 18 bytes
+        assert_eq!(probe.predicate.len(), 18);
         assert_eq!(probe.predicate[6], Opcode::Lt as u8);
-        assert_eq!(probe.predicate[13], Opcode::Ge as u8);
-        assert_eq!(probe.predicate[14], Opcode::Or as u8);
+        assert_eq!(probe.predicate[7], Opcode::JumpIfTrue as u8);
+        assert_eq!(probe.predicate[16], Opcode::Ge as u8);
+        assert_eq!(probe.predicate[17], Opcode::Truthy as u8);
     }
 
     #[test]
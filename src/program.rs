@@ -88,7 +88,8 @@ impl Program {
         use prost::Message;
 
         let proto = self.to_proto()?;
-        let mut buf = Vec::new();
+        // Size the buffer up front so encoding never reallocates mid-write
+        let mut buf = Vec::with_capacity(proto.encoded_len());
         proto
             .encode(&mut buf)
             .map_err(|e| format!("Failed to encode protobuf: {}", e))?;
@@ -2,6 +2,8 @@
 //!
 //! This module exposes the Rust VM to Python using PyO3.
 
+use std::sync::OnceLock;
+
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::{PyBytes, PyDict, PyFrame};
@@ -29,7 +31,7 @@ use crate::python_dispatcher::PythonDispatcher;
 #[pyfunction]
 fn compile(source: &str) -> PyResult<PyProgram> {
     parser::parse(source)
-        .map(|program| PyProgram { inner: program })
+        .map(PyProgram::new)
         .map_err(|e| PyValueError::new_err(format!("Compilation error: {}", e)))
 }
 
@@ -40,6 +42,35 @@ fn compile(source: &str) -> PyResult<PyProgram> {
 #[derive(Clone)]
 struct PyProgram {
     inner: Program,
+
+    /// Serialized protobuf form, computed once on first to_bytes() call.
+    /// Programs are immutable after compilation, so the cached encoding
+    /// never goes stale; the OnceLock lets to_bytes keep a shared receiver.
+    cached_proto: OnceLock<Vec<u8>>,
+}
+
+impl PyProgram {
+    fn new(inner: Program) -> Self {
+        PyProgram {
+            inner,
+            cached_proto: OnceLock::new(),
+        }
+    }
+
+    /// Probes whose spec matches the given target
+    fn probes_for_target(&self, wanted: FnTarget) -> Vec<PyProbe> {
+        self.inner
+            .probes
+            .iter()
+            .filter(|probe| {
+                let ProbeSpec::Fn { target, .. } = &probe.spec;
+                *target == wanted
+            })
+            .map(|probe| PyProbe {
+                inner: probe.clone(),
+            })
+            .collect()
+    }
 }
 
 #[pymethods]
@@ -56,6 +87,23 @@ impl PyProgram {
             .collect()
     }
 
+    /// Get only the entry probes in this program
+    ///
+    /// Filters by target on each access, so callers computing per-target
+    /// statistics don't have to scan the full probe list and compare
+    /// target strings in Python. Hold the result if you need it more
+    /// than once; each call clones the matching probes.
+    #[getter]
+    fn entry_probes(&self) -> Vec<PyProbe> {
+        self.probes_for_target(FnTarget::Entry)
+    }
+
+    /// Get only the exit probes in this program
+    #[getter]
+    fn exit_probes(&self) -> Vec<PyProbe> {
+        self.probes_for_target(FnTarget::Exit)
+    }
+
     /// Get the bytecode format version
     #[getter]
     fn version(&self) -> u32 {
@@ -78,10 +126,16 @@ impl PyProgram {
     ///     >>> data = program.to_bytes()
     ///     >>> loaded = Program.from_bytes(data)
     fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
-        self.inner
-            .to_proto_bytes()
-            .map(|bytes| PyBytes::new(py, &bytes))
-            .map_err(|e| PyRuntimeError::new_err(format!("Serialization error: {}", e)))
+        if self.cached_proto.get().is_none() {
+            let bytes = self
+                .inner
+                .to_proto_bytes()
+                .map_err(|e| PyRuntimeError::new_err(format!("Serialization error: {}", e)))?;
+            // A concurrent caller may have won the race; either value is
+            // identical, so the losing set() is safely ignored
+            let _ = self.cached_proto.set(bytes);
+        }
+        Ok(PyBytes::new(py, self.cached_proto.get().unwrap()))
     }
 
     /// Deserialize a program from protobuf bytes
@@ -97,7 +151,7 @@ impl PyProgram {
     #[staticmethod]
     fn from_bytes(data: &[u8]) -> PyResult<PyProgram> {
         Program::from_proto_bytes(data)
-            .map(|program| PyProgram { inner: program })
+            .map(PyProgram::new)
             .map_err(|e| PyRuntimeError::new_err(format!("Deserialization error: {}", e)))
     }
 
@@ -165,6 +219,18 @@ struct PyProbeSpec {
     inner: ProbeSpec,
 }
 
+impl PyProbeSpec {
+    /// The target as a plain string slice (shared by the getters below)
+    fn target_str(&self) -> &'static str {
+        match &self.inner {
+            ProbeSpec::Fn { target, .. } => match target {
+                FnTarget::Entry => "entry",
+                FnTarget::Exit => "exit",
+            },
+        }
+    }
+}
+
 #[pymethods]
 impl PyProbeSpec {
     /// Get the probe specifier (e.g., "myapp.users.create")
@@ -176,19 +242,30 @@ impl PyProbeSpec {
     }
 
     /// Get the probe target ("entry" or "exit")
+    ///
+    /// Returns interned strings so repeated accesses share one Python
+    /// object and equality checks hit the pointer fast path.
     #[getter]
-    fn target(&self) -> &str {
-        match &self.inner {
-            ProbeSpec::Fn { target, .. } => match target {
-                FnTarget::Entry => "entry",
-                FnTarget::Exit => "exit",
-            },
+    fn target<'py>(&self, py: Python<'py>) -> Bound<'py, pyo3::types::PyString> {
+        match self.target_str() {
+            "entry" => pyo3::intern!(py, "entry").clone(),
+            _ => pyo3::intern!(py, "exit").clone(),
         }
     }
 
+    /// Get the full probe specification string (e.g., "fn:myapp.users.create:entry")
+    #[getter]
+    fn full_spec(&self) -> String {
+        format!("fn:{}:{}", self.specifier(), self.target_str())
+    }
+
     /// String representation
     fn __repr__(&self) -> String {
-        format!("fn:{}:{}", self.specifier(), self.target())
+        self.full_spec()
+    }
+
+    fn __str__(&self) -> String {
+        self.full_spec()
     }
 }
 
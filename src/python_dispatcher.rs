@@ -49,6 +49,21 @@ pub struct PythonDispatcher<'py> {
 
     /// Accumulated capture events from capture() calls
     captures: Vec<CaptureEvent>,
+
+    /// Positional parameter names for the frame's code object, derived
+    /// lazily on first argN/args access and reused for the rest of the
+    /// probe execution.
+    arg_names: Option<Vec<String>>,
+
+    /// The frame's f_locals, captured on first use. Every f_locals read
+    /// makes CPython materialize a fresh mapping from the fast-locals
+    /// array, so one snapshot is shared across all lookups in a dispatch.
+    frame_locals: Option<Bound<'py, PyAny>>,
+
+    /// The request store's raw dict for this dispatch, fetched once via
+    /// raw_storage() on first $req access. Inner None means the store
+    /// doesn't expose a dict and get/set method calls are used instead.
+    request_storage: Option<Option<Bound<'py, PyDict>>>,
 }
 
 impl<'py> PythonDispatcher<'py> {
@@ -62,6 +77,9 @@ impl<'py> PythonDispatcher<'py> {
             exception: None,
             store,
             captures: Vec::new(),
+            arg_names: None,
+            frame_locals: None,
+            request_storage: None,
         }
     }
 
@@ -81,6 +99,9 @@ impl<'py> PythonDispatcher<'py> {
             exception,
             store,
             captures: Vec::new(),
+            arg_names: None,
+            frame_locals: None,
+            request_storage: None,
         }
     }
 
@@ -90,13 +111,17 @@ impl<'py> PythonDispatcher<'py> {
     }
 
     /// Convert a CaptureEvent to a Python dictionary
+    ///
+    /// Keys are interned: the same capture() keywords recur on every event
+    /// a probe emits, so interning shares one string object across events
+    /// and lets downstream dict lookups take the pointer-equality fast path.
     pub fn capture_to_py_dict(&self, capture: &CaptureEvent) -> PyResult<Py<PyDict>> {
         let dict = PyDict::new(self.py);
         for (key, value) in &capture.data {
             let py_value = self
                 .value_to_py(value)
                 .map_err(PyErr::new::<pyo3::exceptions::PyValueError, _>)?;
-            dict.set_item(key, py_value)?;
+            dict.set_item(PyString::intern(self.py, key), py_value)?;
         }
         Ok(dict.into())
     }
@@ -141,42 +166,112 @@ impl<'py> PythonDispatcher<'py> {
         }
     }
 
-    /// Get function arguments as a tuple
-    fn get_args(&self) -> Result<Value, String> {
-        // Access frame locals to get function arguments
-        // This is a simplified implementation - in production, you'd need to
-        // properly extract arguments from the frame based on the code object
-        let locals = self
+    /// Ensure the positional parameter names are cached, computing them
+    /// from the frame's code object on first use
+    ///
+    /// Reads co_varnames[:co_argcount] directly rather than going through
+    /// Python-level inspect machinery. Probes that touch several argN
+    /// variables (or argN plus args) pay the derivation cost only once.
+    fn ensure_arg_names(&mut self) -> Result<(), String> {
+        if self.arg_names.is_some() {
+            return Ok(());
+        }
+        let code = self
             .frame
-            .getattr("f_locals")
-            .map_err(|e| format!("Failed to get f_locals: {}", e))?;
+            .getattr(pyo3::intern!(self.py, "f_code"))
+            .map_err(|e| format!("Failed to get f_code: {}", e))?;
+        let argcount: usize = code
+            .getattr(pyo3::intern!(self.py, "co_argcount"))
+            .and_then(|v| v.extract())
+            .map_err(|e| format!("Failed to get co_argcount: {}", e))?;
+        let varnames = code
+            .getattr(pyo3::intern!(self.py, "co_varnames"))
+            .map_err(|e| format!("Failed to get co_varnames: {}", e))?;
+        let varnames = varnames
+            .cast_into::<PyTuple>()
+            .map_err(|_| "co_varnames is not a tuple".to_string())?;
+
+        let mut names = Vec::with_capacity(argcount);
+        for i in 0..argcount {
+            let name: String = varnames
+                .get_item(i)
+                .and_then(|v| v.extract())
+                .map_err(|e| format!("Failed to read co_varnames[{}]: {}", i, e))?;
+            names.push(name);
+        }
+        self.arg_names = Some(names);
+        Ok(())
+    }
 
-        let args = locals
-            .get_item("args")
+    /// Get the request store's raw dict, fetched once per dispatch
+    ///
+    /// Probes that touch several $req variables would otherwise pay a
+    /// Python method call (store.get/store.set -> _get_storage) for each
+    /// one; with the dict in hand those become plain dict operations.
+    fn request_storage(&mut self) -> Option<Bound<'py, PyDict>> {
+        if let Some(cached) = &self.request_storage {
+            return cached.clone();
+        }
+        let storage = self
+            .store
+            .bind(self.py)
+            .call_method0(pyo3::intern!(self.py, "raw_storage"))
             .ok()
-            .unwrap_or_else(|| PyTuple::empty(self.py).into_any());
-
-        self.py_to_value(&args)
+            .and_then(|obj| obj.cast_into::<PyDict>().ok());
+        self.request_storage = Some(storage.clone());
+        storage
     }
 
-    /// Get a specific positional argument by index
-    fn get_arg_n(&self, n: usize) -> Result<Value, String> {
-        // Similar to get_args, but extract specific argument
-        // This is simplified - proper implementation would inspect the code object
+    /// Get the frame's f_locals, materializing the mapping once per dispatch
+    fn frame_locals(&mut self) -> Result<Bound<'py, PyAny>, String> {
+        if let Some(locals) = &self.frame_locals {
+            return Ok(locals.clone());
+        }
         let locals = self
             .frame
-            .getattr("f_locals")
+            .getattr(pyo3::intern!(self.py, "f_locals"))
             .map_err(|e| format!("Failed to get f_locals: {}", e))?;
+        self.frame_locals = Some(locals.clone());
+        Ok(locals)
+    }
 
-        // Try to get from args tuple
-        if let Ok(args_obj) = locals.get_item("args")
-            && let Ok(args_tuple) = args_obj.cast_into::<PyTuple>()
-            && let Ok(arg) = args_tuple.get_item(n)
-        {
-            return self.py_to_value(&arg);
+    /// Get function arguments as a tuple
+    ///
+    /// Arguments are resolved from the code object's positional parameter
+    /// names and the frame's locals, so `args` works for any traced function
+    /// (not just ones that happen to have a local named "args").
+    fn get_args(&mut self) -> Result<Value, String> {
+        self.ensure_arg_names()?;
+        let locals = self.frame_locals()?;
+        let names = self.arg_names.as_ref().unwrap();
+
+        let mut values = Vec::with_capacity(names.len());
+        for name in names {
+            let value = locals
+                .get_item(PyString::intern(self.py, name))
+                .map_err(|e| format!("Argument {} not found in frame locals: {}", name, e))?;
+            values.push(value);
         }
 
-        Err(format!("Argument {} not found", n))
+        let args = PyTuple::new(self.py, &values)
+            .map_err(|e| format!("Failed to build args tuple: {}", e))?;
+        self.py_to_value(args.as_any())
+    }
+
+    /// Get a specific positional argument by index
+    fn get_arg_n(&mut self, n: usize) -> Result<Value, String> {
+        self.ensure_arg_names()?;
+        let locals = self.frame_locals()?;
+        let name = self
+            .arg_names
+            .as_ref()
+            .unwrap()
+            .get(n)
+            .ok_or_else(|| format!("Argument {} not found", n))?;
+        locals
+            .get_item(PyString::intern(self.py, name))
+            .map_err(|e| format!("Argument {} not found in frame locals: {}", n, e))
+            .and_then(|obj| self.py_to_value(&obj))
     }
 }
 
@@ -192,12 +287,9 @@ impl<'py> Dispatcher for PythonDispatcher<'py> {
             "args" => self.get_args(),
             "kwargs" => {
                 // Get keyword arguments from frame
-                let locals = self
-                    .frame
-                    .getattr("f_locals")
-                    .map_err(|e| format!("Failed to get f_locals: {}", e))?;
+                let locals = self.frame_locals()?;
                 let kwargs = locals
-                    .get_item("kwargs")
+                    .get_item(pyo3::intern!(self.py, "kwargs"))
                     .ok()
                     .unwrap_or_else(|| PyDict::new(self.py).into_any());
                 self.py_to_value(&kwargs)
@@ -222,28 +314,22 @@ impl<'py> Dispatcher for PythonDispatcher<'py> {
             }
             "self" => {
                 // Get 'self' from locals (for method calls)
-                let locals = self
-                    .frame
-                    .getattr("f_locals")
-                    .map_err(|e| format!("Failed to get f_locals: {}", e))?;
+                let locals = self.frame_locals()?;
                 locals
-                    .get_item("self")
+                    .get_item(pyo3::intern!(self.py, "self"))
                     .map_err(|e| format!("'self' not found: {}", e))
                     .and_then(|obj| self.py_to_value(&obj))
             }
             "locals" => {
                 // Return all local variables as a dict
-                let locals = self
-                    .frame
-                    .getattr("f_locals")
-                    .map_err(|e| format!("Failed to get f_locals: {}", e))?;
+                let locals = self.frame_locals()?;
                 self.py_to_value(&locals)
             }
             "globals" => {
                 // Return all global variables as a dict
                 let globals = self
                     .frame
-                    .getattr("f_globals")
+                    .getattr(pyo3::intern!(self.py, "f_globals"))
                     .map_err(|e| format!("Failed to get f_globals: {}", e))?;
                 self.py_to_value(&globals)
             }
@@ -256,12 +342,9 @@ impl<'py> Dispatcher for PythonDispatcher<'py> {
                 }
 
                 // Try to get from frame locals
-                let locals = self
-                    .frame
-                    .getattr("f_locals")
-                    .map_err(|e| format!("Failed to get f_locals: {}", e))?;
+                let locals = self.frame_locals()?;
                 locals
-                    .get_item(name)
+                    .get_item(PyString::intern(self.py, name))
                     .map_err(|e| format!("Variable {} not found: {}", name, e))
                     .and_then(|obj| self.py_to_value(&obj))
             }
@@ -282,20 +365,37 @@ impl<'py> Dispatcher for PythonDispatcher<'py> {
         if let Value::Object(boxed) = obj
             && boxed.downcast_ref::<RequestStoreProxy>().is_some()
         {
+            // Read straight from the storage dict when the store exposes
+            // it; a missing key yields None just like store.get(attr)
+            if let Some(storage) = self.request_storage() {
+                return match storage
+                    .get_item(PyString::intern(self.py, attr))
+                    .map_err(|e| format!("Failed to get request variable {}: {}", attr, e))?
+                {
+                    Some(result) => self.py_to_value(&result),
+                    None => Ok(Value::None),
+                };
+            }
+
             // Call store.get(attr) which returns None if not set
             let result = self
                 .store
-                .call_method1(self.py, "get", (attr,))
+                .call_method1(self.py, "get", (PyString::intern(self.py, attr),))
                 .map_err(|e| format!("Failed to get request variable {}: {}", attr, e))?;
             return self.py_to_value(result.bind(self.py));
         }
 
-        // Regular attribute access on Python objects
+        // Regular attribute access on Python objects. getattr_opt reports a
+        // missing attribute without materializing an AttributeError, and a
+        // miss yields None in the DTrace style rather than failing the probe
         let py_obj = self.value_to_py(obj)?;
-        py_obj
-            .getattr(attr)
-            .map_err(|e| format!("Failed to get attribute {}: {}", attr, e))
-            .and_then(|result| self.py_to_value(&result))
+        match py_obj
+            .getattr_opt(PyString::intern(self.py, attr))
+            .map_err(|e| format!("Failed to get attribute {}: {}", attr, e))?
+        {
+            Some(result) => self.py_to_value(&result),
+            None => Ok(Value::None),
+        }
     }
 
     fn set_attribute(&mut self, obj: &Value, attr: &str, value: Value) -> Result<(), String> {
@@ -303,10 +403,16 @@ impl<'py> Dispatcher for PythonDispatcher<'py> {
         if let Value::Object(boxed) = obj
             && boxed.downcast_ref::<RequestStoreProxy>().is_some()
         {
-            // Convert value to Python and call store.set(attr, value)
+            // Convert value to Python and store it
             let py_value = self.value_to_py(&value)?;
+            if let Some(storage) = self.request_storage() {
+                storage
+                    .set_item(PyString::intern(self.py, attr), py_value)
+                    .map_err(|e| format!("Failed to set request variable {}: {}", attr, e))?;
+                return Ok(());
+            }
             self.store
-                .call_method1(self.py, "set", (attr, py_value))
+                .call_method1(self.py, "set", (PyString::intern(self.py, attr), py_value))
                 .map_err(|e| format!("Failed to set request variable {}: {}", attr, e))?;
             return Ok(());
         }
@@ -322,6 +428,19 @@ impl<'py> Dispatcher for PythonDispatcher<'py> {
         let py_obj = self.value_to_py(obj)?;
         let py_key = self.value_to_py(key)?;
 
+        // Fast path for dicts: PyDict::get_item signals a missing key
+        // without raising, so probing absent keys (common for HTTP header
+        // lookups) avoids the cost of building and catching a KeyError
+        if let Ok(dict) = py_obj.cast::<PyDict>() {
+            return match dict
+                .get_item(&py_key)
+                .map_err(|e| format!("Failed to get item: {}", e))?
+            {
+                Some(result) => self.py_to_value(&result),
+                None => Ok(Value::None),
+            };
+        }
+
         py_obj
             .get_item(&py_key)
             .map_err(|e| format!("Failed to get item: {}", e))
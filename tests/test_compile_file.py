@@ -0,0 +1,88 @@
+"""
+Tests for compile_file and its sibling .hogtracec bytecode cache.
+
+These verify that:
+- Compiling a file produces a cache next to the source
+- A fresh cache is loaded instead of re-parsing the source
+- Editing the source invalidates the cache
+- Unwritable directories still compile, just without caching
+"""
+
+import os
+
+import hogtrace
+
+SOURCE = "fn:myapp.users.create:entry { capture(args); }"
+OTHER_SOURCE = "fn:myapp.db.query:exit { capture(retval); }"
+
+
+def _write(path, text):
+    path.write_text(text)
+    return path
+
+
+def test_compile_file_writes_cache(tmp_path):
+    """Compiling a file leaves a .hogtracec cache beside it."""
+    source = _write(tmp_path / "probes.hogtrace", SOURCE)
+
+    program = hogtrace.compile_file(source)
+
+    cache = tmp_path / "probes.hogtracec"
+    assert cache.exists()
+    assert cache.read_bytes() == program.to_bytes()
+
+
+def test_compile_file_loads_from_cache(tmp_path):
+    """A fresh cache is used instead of re-parsing the source."""
+    source = _write(tmp_path / "probes.hogtrace", SOURCE)
+    hogtrace.compile_file(source)
+
+    # Swap in a cache for a different program; if compile_file reads the
+    # cache, we get that program back instead of the source's.
+    other = hogtrace.parse(OTHER_SOURCE)
+    cache = tmp_path / "probes.hogtracec"
+    cache.write_bytes(other.to_bytes())
+
+    program = hogtrace.compile_file(source)
+    assert program.probes[0].spec.full_spec == "fn:myapp.db.query:exit"
+
+
+def test_compile_file_recompiles_stale_cache(tmp_path):
+    """A cache older than the source is ignored and rewritten."""
+    source = _write(tmp_path / "probes.hogtrace", SOURCE)
+    hogtrace.compile_file(source)
+
+    source.write_text(OTHER_SOURCE)
+    cache = tmp_path / "probes.hogtracec"
+    # Force the cache to look older than the edited source
+    os.utime(cache, ns=(0, 0))
+
+    program = hogtrace.compile_file(source)
+    assert program.probes[0].spec.full_spec == "fn:myapp.db.query:exit"
+    assert cache.read_bytes() == program.to_bytes()
+
+
+def test_compile_file_ignores_corrupt_cache(tmp_path):
+    """Garbage in the cache file falls back to compiling the source."""
+    source = _write(tmp_path / "probes.hogtrace", SOURCE)
+    (tmp_path / "probes.hogtracec").write_bytes(b"\xff\xfenot a program")
+    # Make sure the corrupt cache looks fresh
+    os.utime(tmp_path / "probes.hogtracec")
+
+    program = hogtrace.compile_file(source)
+    assert program.probes[0].spec.full_spec == "fn:myapp.users.create:entry"
+
+
+def test_compile_file_survives_unwritable_cache(tmp_path, monkeypatch):
+    """A directory where the cache can't be written still compiles."""
+    source = _write(tmp_path / "probes.hogtrace", SOURCE)
+
+    def denied(*args, **kwargs):
+        raise PermissionError("read-only directory")
+
+    # chmod tricks don't work under root, so fail the temp-file creation
+    monkeypatch.setattr(hogtrace.tempfile, "mkstemp", denied)
+
+    program = hogtrace.compile_file(source)
+    assert len(program.probes) == 1
+    assert not (tmp_path / "probes.hogtracec").exists()
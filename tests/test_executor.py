@@ -0,0 +1,194 @@
+"""
+Tests for Python-level probe dispatch (spec_matcher and ProgramExecutor).
+
+These verify that:
+- Literal and wildcard specifiers compile to correct matchers
+- ProgramExecutor dispatches only to probes matching the frame's function
+- Entry and exit probes are selected by retval/exception presence
+"""
+
+import sys
+
+from hogtrace import parse, ProgramExecutor
+from hogtrace.executor import spec_matcher
+from hogtrace.request_store import RequestLocalStore
+
+
+def test_spec_matcher_literal():
+    """Literal specifiers match exactly."""
+    matcher = spec_matcher("myapp.users.create")
+    assert matcher("myapp.users.create")
+    assert not matcher("myapp.users.create_user")
+    assert not matcher("myapp.users")
+
+
+def test_spec_matcher_wildcard():
+    """Wildcard specifiers match glob-style."""
+    matcher = spec_matcher("myapp.api.*")
+    assert matcher("myapp.api.get_user")
+    assert matcher("myapp.api.nested.handler")
+    assert not matcher("myapp.db.query")
+
+
+def test_spec_matcher_is_cached():
+    """The same specifier returns the same compiled matcher."""
+    assert spec_matcher("a.b.*") is spec_matcher("a.b.*")
+
+
+def test_execute_all_dispatches_by_function_name():
+    """Only probes whose spec matches the frame's function fire."""
+    program = parse("""
+        fn:traced_function:entry { capture(x=value); }
+        fn:other_function:entry { capture(y=value); }
+    """)
+    store = RequestLocalStore()
+    executor = ProgramExecutor(program, store)
+
+    def traced_function(value):
+        return executor.execute_all(sys._getframe())
+
+    results = traced_function(42)
+    assert len(results) == 1
+    spec, data = results[0]
+    assert spec == "fn:traced_function:entry"
+    assert data["x"] == 42
+
+
+def test_execute_all_nameless_module_fires_once():
+    """A frame whose globals lack __name__ fires each probe exactly once."""
+    program = parse("fn:traced:entry { capture(x=value); }")
+    store = RequestLocalStore()
+    executor = ProgramExecutor(program, store)
+
+    # exec with a bare dict gives the function __name__-less globals, so
+    # the dotted path and the bare name are the same string.
+    namespace = {"sys": sys, "executor": executor}
+    exec(
+        "def traced(value):\n"
+        "    return executor.execute_all(sys._getframe())\n",
+        namespace,
+    )
+
+    results = namespace["traced"](5)
+    assert results == [("fn:traced:entry", {"x": 5})]
+
+
+def test_execute_all_entry_vs_exit():
+    """Entry probes fire without retval; exit probes fire with it."""
+    program = parse("""
+        fn:traced_function:entry { capture(phase="entry"); }
+        fn:traced_function:exit { capture(result=retval); }
+    """)
+    store = RequestLocalStore()
+    executor = ProgramExecutor(program, store)
+
+    def traced_function():
+        frame = sys._getframe()
+        entry = executor.execute_all(frame)
+        exit_ = executor.execute_all(frame, retval="ok")
+        return entry, exit_
+
+    entry, exit_ = traced_function()
+    assert len(entry) == 1
+    assert entry[0][1]["phase"] == "entry"
+    assert len(exit_) == 1
+    assert exit_[0][1]["result"] == "ok"
+
+
+def test_execute_all_wildcard_spec():
+    """Wildcard probes match any function under the glob."""
+    program = parse("fn:*:entry { capture(x=value); }")
+    store = RequestLocalStore()
+    executor = ProgramExecutor(program, store)
+
+    def anything(value):
+        return executor.execute_all(sys._getframe())
+
+    results = anything(7)
+    assert len(results) == 1
+    assert results[0][1]["x"] == 7
+
+
+def test_execute_all_resolves_positional_args():
+    """arg0/arg1 and args resolve from the frame's positional parameters."""
+    program = parse("fn:traced_function:entry { capture(a=arg0, b=arg1, n=len(args)); }")
+    store = RequestLocalStore()
+    executor = ProgramExecutor(program, store)
+
+    def traced_function(first, second):
+        return executor.execute_all(sys._getframe())
+
+    results = traced_function(10, "hi")
+    assert len(results) == 1
+    data = results[0][1]
+    assert data["a"] == 10
+    assert data["b"] == "hi"
+    assert data["n"] == 2
+
+
+def test_predicate_short_circuits_and():
+    """&& skips the right side when the left side already fails."""
+    program = parse("""
+        fn:traced_function:entry
+        / arg0 != None && arg0.role == "admin" /
+        { capture(role=arg0.role); }
+    """)
+    store = RequestLocalStore()
+    executor = ProgramExecutor(program, store)
+
+    def traced_function(user):
+        return executor.execute_all(sys._getframe())
+
+    # Without short-circuit, arg0.role on None would raise at runtime
+    assert traced_function(None) == []
+
+    class User:
+        role = "admin"
+
+    results = traced_function(User())
+    assert len(results) == 1
+    assert results[0][1]["role"] == "admin"
+
+
+def test_missing_dict_key_yields_none():
+    """Indexing a dict with an absent key captures None instead of failing."""
+    program = parse("""
+        fn:traced_function:entry { capture(present=arg0["a"], absent=arg0["missing"]); }
+    """)
+    store = RequestLocalStore()
+    executor = ProgramExecutor(program, store)
+
+    def traced_function(headers):
+        return executor.execute_all(sys._getframe())
+
+    results = traced_function({"a": 1})
+    assert len(results) == 1
+    assert results[0][1]["present"] == 1
+    assert results[0][1]["absent"] is None
+
+
+def test_missing_attribute_yields_none():
+    """Reading an absent attribute captures None instead of failing."""
+    program = parse("fn:traced_function:entry { capture(v=arg0.nope); }")
+    store = RequestLocalStore()
+    executor = ProgramExecutor(program, store)
+
+    def traced_function(obj):
+        return executor.execute_all(sys._getframe())
+
+    class Empty:
+        pass
+
+    results = traced_function(Empty())
+    assert len(results) == 1
+    assert results[0][1]["v"] is None
+
+
+def test_executors_attribute_exposes_probe_executors():
+    """One ProbeExecutor is created per probe."""
+    program = parse("""
+        fn:a:entry { capture(args); }
+        fn:b:exit { capture(retval); }
+    """)
+    executor = ProgramExecutor(program, RequestLocalStore())
+    assert len(executor.executors) == 2
@@ -0,0 +1,28 @@
+"""
+Tests for the parse()/parse_bytes() wrappers.
+
+These cover the fast-reject pre-check: it must never reject a program
+that the real parser accepts, for either supported provider keyword.
+"""
+
+import pytest
+
+from hogtrace import parse, parse_bytes, ParseError
+
+
+def test_parse_accepts_py_provider():
+    """The py: provider must get past the fast-reject to the parser."""
+    program = parse("py:myapp.handler:entry { capture(args); }")
+    assert len(program.probes) == 1
+
+
+def test_parse_bytes_accepts_py_provider():
+    """Same as above for the bytes-level pre-check."""
+    program = parse_bytes(b"py:myapp.handler:entry { capture(args); }")
+    assert len(program.probes) == 1
+
+
+def test_parse_fast_rejects_garbage():
+    """Input with no provider keyword or comment fails without lexing."""
+    with pytest.raises(ParseError, match="no probe specification"):
+        parse("this is not a trace program")
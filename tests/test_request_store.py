@@ -255,5 +255,21 @@ def test_conditional_with_request_vars():
     assert result3 is None
 
 
+def test_raw_storage_is_live_dict():
+    """raw_storage() exposes the live dict the VM writes through."""
+    program = compile("fn:test:entry { $req.user_id = 7; }")
+
+    store = RequestLocalStore()
+    frame = sys._getframe()
+    execute_probe(program, program.probes[0], frame, store)
+
+    storage = store.raw_storage()
+    assert storage["user_id"] == 7
+
+    # Not a copy: mutations are visible through the store API
+    storage["other"] = "x"
+    assert store.get("other") == "x"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])